@@ -2,24 +2,138 @@
 Analysis utilities for NBER papers data
 """
 
+import heapq
+import importlib.util
 import json
 import re
-from collections import Counter, defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from operator import itemgetter
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Matches one whitespace-delimited token; used for counting words without
+# materializing the token list that str.split() would allocate
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def _word_count(text: str) -> int:
+    """Count whitespace-delimited words without building a token list."""
+    if not text:
+        return 0
+    return sum(1 for _ in _TOKEN_RE.finditer(text))
+
+
+def _list_len(value: Any) -> int:
+    """Length of a list-valued cell, treating None/missing as empty."""
+    return len(value) if isinstance(value, list) else 0
+
+
+def _list_join(value: Any) -> Optional[str]:
+    """Collapse a list-valued cell to a comma-separated string."""
+    if isinstance(value, list) and value:
+        return ', '.join(value)
+    return None
+
+
+# The fields a canonical paper record carries; ingest normalizes every
+# record to exactly this shape so downstream access never has to guard
+# against missing keys
+_PAPER_FIELDS = (
+    'paper_id', 'title', 'abstract', 'url', 'pdf_url', 'date',
+    'publication_date', 'doi', 'scraped_at', 'authors', 'jel_codes'
+)
+
+
+def _canonicalize(paper: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a raw paper record to the canonical field set."""
+    record = {field: paper.get(field) for field in _PAPER_FIELDS}
+    # The scraper emits publication_date rather than date; mirror it so
+    # the date-based analyses work on real scraper output
+    if record['date'] is None:
+        record['date'] = record['publication_date']
+    return record
+
+
+# Common stop words excluded from keyword extraction; built once at import
+_STOP_WORDS = frozenset({
+    'the', 'this', 'that', 'with', 'from', 'they', 'have', 'been', 'their',
+    'are', 'was', 'were', 'will', 'would', 'could', 'should', 'may', 'might',
+    'can', 'does', 'did', 'has', 'had', 'also', 'more', 'most', 'some', 'any',
+    'and', 'but', 'for', 'not', 'you', 'all', 'each', 'one', 'two', 'both',
+    'between', 'among', 'within', 'without', 'through', 'during', 'before',
+    'after', 'above', 'below', 'into', 'onto', 'upon', 'over', 'under',
+    'paper', 'study', 'research', 'analysis', 'data', 'results', 'find',
+    'found', 'show', 'shows', 'using', 'used', 'use', 'based', 'approach'
+})
+
+# Matches a plausible publication year (non-capturing to skip group allocation)
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Column order for to_dataframe output
+_DF_COLS = (
+    'paper_id', 'title', 'abstract', 'url', 'pdf_url', 'date', 'scraped_at',
+    'num_authors', 'num_jel_codes', 'has_abstract', 'has_pdf',
+    'abstract_length', 'authors', 'jel_codes'
+)
+
+# Explicit dtypes for the derived columns; the pandas defaults (int64/object)
+# waste 4-8x the memory these small counters and flags actually need
+_DF_DTYPES = {
+    'num_authors': 'uint16',
+    'num_jel_codes': 'uint16',
+    'abstract_length': 'uint32',
+    'has_abstract': 'bool',
+    'has_pdf': 'bool',
+}
+
+# Probe for the optional analysis stack without importing it; matplotlib
+# alone costs hundreds of milliseconds and tens of MB at import time, so the
+# heavy modules are imported lazily inside the methods that need them
+ANALYSIS_DEPS_AVAILABLE = all(
+    importlib.util.find_spec(mod) is not None
+    for mod in ('pandas', 'matplotlib', 'seaborn', 'wordcloud')
+)
+if not ANALYSIS_DEPS_AVAILABLE:
+    logger.warning("Analysis dependencies not available. Install pandas, matplotlib, seaborn, and wordcloud for full functionality.")
+
 try:
-    import pandas as pd
-    import matplotlib.pyplot as plt
-    import seaborn as sns
-    from wordcloud import WordCloud
-    ANALYSIS_DEPS_AVAILABLE = True
+    import ijson
+    IJSON_AVAILABLE = True
 except ImportError:
-    ANALYSIS_DEPS_AVAILABLE = False
-    logger.warning("Analysis dependencies not available. Install pandas, matplotlib, seaborn, and wordcloud for full functionality.")
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def iter_papers(filepath: str):
+    """
+    Yield papers one at a time from a JSON array file.
+
+    Uses ijson for incremental parsing when available, so large scrape dumps
+    are never fully resident in memory; falls back to json.load otherwise.
+
+    Args:
+        filepath: Path to JSON file containing a list of papers
+
+    Yields:
+        Paper dictionaries in file order
+    """
+    if IJSON_AVAILABLE:
+        with open(filepath, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
 
 
 class PaperAnalyzer:
@@ -33,20 +147,63 @@ class PaperAnalyzer:
             data_source: Path to JSON file or None to use empty dataset
         """
         self.papers_data: List[Dict[str, Any]] = []
-        
+        self._rebuild_columns()
+
         if data_source:
             self.load_data(data_source)
+
+    def _rebuild_columns(self) -> None:
+        """
+        Transpose papers_data into flat column lists.
+
+        The analytic methods each touch only one or two fields per paper;
+        scanning a flat column avoids a dict lookup per paper per field and
+        keeps the bytes being scanned contiguous. Called by the mutators
+        (load_data/add_data) whenever papers_data changes, which also
+        invalidates any cached analytic results.
+        """
+        self._cache: Dict[Any, Any] = {}
+        papers = self.papers_data
+        self._abstracts = [p.get('abstract') for p in papers]
+        # Word counts are the heaviest per-paper work in this module;
+        # compute them once here and share across the stats/DataFrame paths
+        self._abstract_lens = [_word_count(a) for a in self._abstracts]
+        self._authors = [p.get('authors') for p in papers]
+        self._jel_codes = [p.get('jel_codes') for p in papers]
+        self._dates = [p.get('date') for p in papers]
+        self._pdf_urls = [p.get('pdf_url') for p in papers]
+        self._scraped_at = [p.get('scraped_at') for p in papers]
+
+        # Flattened author/JEL lists so counting is a single C-level pass
+        self._all_authors = list(chain.from_iterable(
+            authors for authors in self._authors if authors))
+        self._all_jel_codes = list(chain.from_iterable(
+            jel_codes for jel_codes in self._jel_codes if jel_codes))
     
-    def load_data(self, filepath: str) -> None:
+    def load_data(self, filepath: str, streaming: bool = False) -> None:
         """
         Load papers data from JSON file.
-        
+
         Args:
             filepath: Path to JSON file containing papers data
+            streaming: Parse the file incrementally with ijson instead of
+                materializing the raw document first (for very large dumps)
+
+        Raises:
+            ImportError: If streaming is requested but ijson is not available
         """
+        if streaming and not IJSON_AVAILABLE:
+            raise ImportError("ijson is required for streaming load")
+
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                self.papers_data = json.load(f)
+            if streaming:
+                self.papers_data = [_canonicalize(p) for p in iter_papers(filepath)]
+            else:
+                # orjson parses the raw bytes several times faster than
+                # stdlib json when it is installed
+                with open(filepath, 'rb') as f:
+                    self.papers_data = [_canonicalize(p) for p in _loads(f.read())]
+            self._rebuild_columns()
             logger.info(f"Loaded {len(self.papers_data)} papers from {filepath}")
         except Exception as e:
             logger.error(f"Error loading data from {filepath}: {e}")
@@ -55,75 +212,95 @@ class PaperAnalyzer:
     def add_data(self, papers: List[Dict[str, Any]]) -> None:
         """
         Add papers data directly.
-        
+
+        Records are normalized to the canonical field set on the way in,
+        so every stored paper carries the same keys.
+
         Args:
             papers: List of paper dictionaries
         """
-        self.papers_data.extend(papers)
+        self.papers_data.extend(_canonicalize(p) for p in papers)
+        self._rebuild_columns()
         logger.info(f"Added {len(papers)} papers to analyzer")
     
     def get_summary_stats(self) -> Dict[str, Any]:
         """
         Get comprehensive summary statistics.
-        
+
+        Each statistic is accumulated in a single scan of the column it
+        needs rather than a pass over the full paper dicts, which matters
+        for large scrape dumps.
+
         Returns:
             Dictionary containing summary statistics
         """
         if not self.papers_data:
             return {"total_papers": 0}
-        
-        # Basic counts
+
+        # Cached paths hand out copies so a caller mutating the result
+        # can't corrupt what later calls see
+        cached = self._cache.get('summary_stats')
+        if cached is not None:
+            return dict(cached)
+
+        # Abstract length stats come from the word counts precomputed at
+        # ingest; only papers that actually have an abstract participate
+        lengths = [length for abstract, length
+                   in zip(self._abstracts, self._abstract_lens) if abstract]
+        n_abstracts = len(lengths)
+
+        # Presence counters: map(bool) + sum run the scan and branch in C
+        n_pdf_urls = sum(map(bool, self._pdf_urls))
+        n_dates = sum(map(bool, self._dates))
+        n_authors = sum(map(bool, self._authors))
+        n_jel = sum(map(bool, self._jel_codes))
+
+        # Author/JEL totals come straight from the flattened ingest lists
+        total_authors = len(self._all_authors)
+        unique_authors = set(self._all_authors)
+        total_jel_codes = len(self._all_jel_codes)
+        unique_jel_codes = set(self._all_jel_codes)
+
+        earliest_scrape = latest_scrape = None
+        for scraped_at in self._scraped_at:
+            if scraped_at:
+                if earliest_scrape is None or scraped_at < earliest_scrape:
+                    earliest_scrape = scraped_at
+                if latest_scrape is None or scraped_at > latest_scrape:
+                    latest_scrape = scraped_at
+
         stats = {
             "total_papers": len(self.papers_data),
-            "papers_with_abstracts": sum(1 for p in self.papers_data if p.get('abstract')),
-            "papers_with_pdf_urls": sum(1 for p in self.papers_data if p.get('pdf_url')),
-            "papers_with_authors": sum(1 for p in self.papers_data if p.get('authors')),
-            "papers_with_jel_codes": sum(1 for p in self.papers_data if p.get('jel_codes')),
-            "papers_with_dates": sum(1 for p in self.papers_data if p.get('date')),
+            "papers_with_abstracts": n_abstracts,
+            "papers_with_pdf_urls": n_pdf_urls,
+            "papers_with_authors": n_authors,
+            "papers_with_jel_codes": n_jel,
+            "papers_with_dates": n_dates,
+            "total_authors": total_authors,
+            "unique_authors": len(unique_authors),
+            "avg_authors_per_paper": total_authors / len(self.papers_data),
         }
-        
-        # Author statistics
-        all_authors = []
-        for paper in self.papers_data:
-            if paper.get('authors'):
-                all_authors.extend(paper['authors'])
-        
-        stats.update({
-            "total_authors": len(all_authors),
-            "unique_authors": len(set(all_authors)),
-            "avg_authors_per_paper": len(all_authors) / len(self.papers_data) if self.papers_data else 0
-        })
-        
-        # Abstract statistics
-        abstracts = [p.get('abstract', '') for p in self.papers_data if p.get('abstract')]
-        if abstracts:
-            abstract_lengths = [len(abstract.split()) for abstract in abstracts]
+
+        if n_abstracts:
             stats.update({
-                "avg_abstract_length": sum(abstract_lengths) / len(abstract_lengths),
-                "min_abstract_length": min(abstract_lengths),
-                "max_abstract_length": max(abstract_lengths)
+                "avg_abstract_length": sum(lengths) / n_abstracts,
+                "min_abstract_length": min(lengths),
+                "max_abstract_length": max(lengths)
             })
-        
-        # JEL codes statistics
-        all_jel_codes = []
-        for paper in self.papers_data:
-            if paper.get('jel_codes'):
-                all_jel_codes.extend(paper['jel_codes'])
-        
+
         stats.update({
-            "total_jel_codes": len(all_jel_codes),
-            "unique_jel_codes": len(set(all_jel_codes))
+            "total_jel_codes": total_jel_codes,
+            "unique_jel_codes": len(unique_jel_codes)
         })
-        
-        # Data collection info
-        scrape_dates = [p.get('scraped_at') for p in self.papers_data if p.get('scraped_at')]
-        if scrape_dates:
+
+        if earliest_scrape is not None:
             stats.update({
-                "earliest_scrape": min(scrape_dates),
-                "latest_scrape": max(scrape_dates)
+                "earliest_scrape": earliest_scrape,
+                "latest_scrape": latest_scrape
             })
-        
-        return stats
+
+        self._cache['summary_stats'] = stats
+        return dict(stats)
     
     def analyze_by_year(self) -> Dict[str, int]:
         """
@@ -132,18 +309,20 @@ class PaperAnalyzer:
         Returns:
             Dictionary mapping years to paper counts
         """
-        year_counts = defaultdict(int)
-        
-        for paper in self.papers_data:
-            date_str = paper.get('date', '')
-            if date_str:
-                # Extract year from various date formats
-                year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
-                if year_match:
-                    year = year_match.group()
-                    year_counts[year] += 1
-        
-        return dict(sorted(year_counts.items()))
+        cached = self._cache.get('by_year')
+        if cached is not None:
+            return dict(cached)
+
+        # Extract years from the various date formats and count them in a
+        # single C-level Counter pass over the dates column
+        year_counts = Counter(
+            match.group() for date_str in self._dates
+            if date_str and (match := _YEAR_RE.search(date_str))
+        )
+
+        result = dict(sorted(year_counts.items()))
+        self._cache['by_year'] = result
+        return dict(result)
     
     def get_top_authors(self, top_n: int = 10) -> List[Tuple[str, int]]:
         """
@@ -155,14 +334,16 @@ class PaperAnalyzer:
         Returns:
             List of (author_name, paper_count) tuples
         """
-        author_counts = Counter()
-        
-        for paper in self.papers_data:
-            if paper.get('authors'):
-                for author in paper['authors']:
-                    author_counts[author] += 1
-        
-        return author_counts.most_common(top_n)
+        cached = self._cache.get(('top_authors', top_n))
+        if cached is not None:
+            return list(cached)
+
+        author_counts = Counter(self._all_authors)
+
+        # O(N log top_n) selection instead of sorting every unique author
+        result = heapq.nlargest(top_n, author_counts.items(), key=itemgetter(1))
+        self._cache[('top_authors', top_n)] = result
+        return list(result)
     
     def get_top_jel_codes(self, top_n: int = 10) -> List[Tuple[str, int]]:
         """
@@ -174,14 +355,15 @@ class PaperAnalyzer:
         Returns:
             List of (jel_code, count) tuples
         """
-        jel_counts = Counter()
-        
-        for paper in self.papers_data:
-            if paper.get('jel_codes'):
-                for code in paper['jel_codes']:
-                    jel_counts[code] += 1
-        
-        return jel_counts.most_common(top_n)
+        cached = self._cache.get(('top_jel_codes', top_n))
+        if cached is not None:
+            return list(cached)
+
+        jel_counts = Counter(self._all_jel_codes)
+
+        result = heapq.nlargest(top_n, jel_counts.items(), key=itemgetter(1))
+        self._cache[('top_jel_codes', top_n)] = result
+        return list(result)
     
     def extract_keywords(self, top_n: int = 20, min_length: int = 4) -> List[Tuple[str, int]]:
         """
@@ -194,30 +376,30 @@ class PaperAnalyzer:
         Returns:
             List of (keyword, frequency) tuples
         """
-        # Common stop words to exclude
-        stop_words = {
-            'the', 'this', 'that', 'with', 'from', 'they', 'have', 'been', 'their',
-            'are', 'was', 'were', 'will', 'would', 'could', 'should', 'may', 'might',
-            'can', 'does', 'did', 'has', 'had', 'also', 'more', 'most', 'some', 'any',
-            'and', 'but', 'for', 'not', 'you', 'all', 'each', 'one', 'two', 'both',
-            'between', 'among', 'within', 'without', 'through', 'during', 'before',
-            'after', 'above', 'below', 'into', 'onto', 'upon', 'over', 'under',
-            'paper', 'study', 'research', 'analysis', 'data', 'results', 'find',
-            'found', 'show', 'shows', 'using', 'used', 'use', 'based', 'approach'
-        }
-        
+        cached = self._cache.get(('keywords', top_n, min_length))
+        if cached is not None:
+            return list(cached)
+
+        # Bake the length requirement into the pattern so short tokens are
+        # rejected by the regex engine rather than a per-word length check
+        word_re = re.compile(rf'[a-zA-Z]{{{min_length},}}')
+
+        # Concatenate all abstracts into one buffer (newline-joined so no
+        # tokens merge across papers) so lowercasing and tokenization run as
+        # a single C-level scan instead of one per abstract
+        buffer = '\n'.join(
+            abstract for abstract in self._abstracts if abstract).lower()
+
+        # Counter.update runs the accumulation loop in C
         word_counts = Counter()
-        
-        for paper in self.papers_data:
-            abstract = paper.get('abstract', '')
-            if abstract:
-                # Clean and extract words
-                words = re.findall(r'\b[a-zA-Z]+\b', abstract.lower())
-                for word in words:
-                    if len(word) >= min_length and word not in stop_words:
-                        word_counts[word] += 1
-        
-        return word_counts.most_common(top_n)
+        word_counts.update(
+            word for word in word_re.findall(buffer)
+            if word not in _STOP_WORDS
+        )
+
+        result = word_counts.most_common(top_n)
+        self._cache[('keywords', top_n, min_length)] = result
+        return list(result)
     
     def to_dataframe(self) -> 'pd.DataFrame':
         """
@@ -231,40 +413,31 @@ class PaperAnalyzer:
         """
         if not ANALYSIS_DEPS_AVAILABLE:
             raise ImportError("pandas is required for DataFrame functionality")
-        
-        # Flatten the data for DataFrame
-        df_data = []
-        for paper in self.papers_data:
-            row = {
-                'paper_id': paper.get('paper_id'),
-                'title': paper.get('title'),
-                'abstract': paper.get('abstract'),
-                'url': paper.get('url'),
-                'pdf_url': paper.get('pdf_url'),
-                'date': paper.get('date'),
-                'scraped_at': paper.get('scraped_at'),
-                'num_authors': len(paper.get('authors', [])),
-                'num_jel_codes': len(paper.get('jel_codes', [])),
-                'has_abstract': bool(paper.get('abstract')),
-                'has_pdf': bool(paper.get('pdf_url')),
-                'abstract_length': len(paper.get('abstract', '').split()) if paper.get('abstract') else 0
-            }
-            
-            # Add authors as comma-separated string
-            if paper.get('authors'):
-                row['authors'] = ', '.join(paper['authors'])
-            else:
-                row['authors'] = None
-            
-            # Add JEL codes as comma-separated string
-            if paper.get('jel_codes'):
-                row['jel_codes'] = ', '.join(paper['jel_codes'])
-            else:
-                row['jel_codes'] = None
-            
-            df_data.append(row)
-        
-        return pd.DataFrame(df_data)
+
+        import pandas as pd
+
+        # Flatten once in pandas rather than building a list of row dicts
+        df = pd.json_normalize(self.papers_data)
+
+        # Make sure every expected source column exists for sparse inputs
+        for col in ('paper_id', 'title', 'abstract', 'url', 'pdf_url',
+                    'date', 'scraped_at', 'authors', 'jel_codes'):
+            if col not in df.columns:
+                df[col] = None
+
+        # Derive the scalar columns with vectorized operations
+        abstracts = df['abstract'].fillna('')
+        df['num_authors'] = df['authors'].map(_list_len)
+        df['num_jel_codes'] = df['jel_codes'].map(_list_len)
+        df['has_abstract'] = abstracts.astype(bool)
+        df['has_pdf'] = df['pdf_url'].fillna('').astype(bool)
+        df['abstract_length'] = self._abstract_lens
+
+        # Collapse list columns into comma-separated strings
+        df['authors'] = df['authors'].map(_list_join)
+        df['jel_codes'] = df['jel_codes'].map(_list_join)
+
+        return df[list(_DF_COLS)].astype(_DF_DTYPES, copy=False)
     
     def create_word_cloud(self, output_path: str = "wordcloud.png", 
                          width: int = 800, height: int = 400) -> None:
@@ -281,26 +454,26 @@ class PaperAnalyzer:
         """
         if not ANALYSIS_DEPS_AVAILABLE:
             raise ImportError("wordcloud is required for word cloud functionality")
-        
-        # Combine all abstracts
-        all_text = ' '.join([
-            paper.get('abstract', '') for paper in self.papers_data 
-            if paper.get('abstract')
-        ])
-        
-        if not all_text:
+
+        from wordcloud import WordCloud
+
+        # Feed pre-computed keyword frequencies instead of joining all
+        # abstracts into one huge string for wordcloud to re-tokenize
+        frequencies = dict(self.extract_keywords(top_n=500, min_length=3))
+
+        if not frequencies:
             logger.warning("No abstracts available for word cloud generation")
             return
-        
+
         # Create word cloud
         wordcloud = WordCloud(
-            width=width, 
-            height=height, 
+            width=width,
+            height=height,
             background_color='white',
             max_words=100,
             colormap='viridis'
-        ).generate(all_text)
-        
+        ).generate_from_frequencies(frequencies)
+
         # Save to file
         wordcloud.to_file(output_path)
         logger.info(f"Word cloud saved to {output_path}")
@@ -317,7 +490,10 @@ class PaperAnalyzer:
         """
         if not ANALYSIS_DEPS_AVAILABLE:
             raise ImportError("matplotlib and seaborn are required for plotting")
-        
+
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         year_counts = self.analyze_by_year()
         
         if not year_counts:
@@ -399,22 +575,31 @@ class PaperAnalyzer:
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write('\n'.join(report_lines))
         
-        # Generate visualizations if possible
-        if ANALYSIS_DEPS_AVAILABLE:
-            try:
-                self.plot_papers_by_year(os.path.join(output_dir, "papers_by_year.png"))
-                self.create_word_cloud(os.path.join(output_dir, "abstract_wordcloud.png"))
-            except Exception as e:
-                logger.warning(f"Error generating visualizations: {e}")
-        
-        # Save DataFrame if possible
+        # Generate visualizations and the CSV export if possible; the three
+        # artifacts are independent, so run them concurrently and keep the
+        # existing best-effort semantics per task
         if ANALYSIS_DEPS_AVAILABLE:
-            try:
+            def save_csv():
                 df = self.to_dataframe()
                 df.to_csv(os.path.join(output_dir, "papers_data.csv"), index=False)
                 logger.info("Saved papers data to CSV")
-            except Exception as e:
-                logger.warning(f"Error saving CSV: {e}")
+
+            tasks = {
+                'year plot': lambda: self.plot_papers_by_year(
+                    os.path.join(output_dir, "papers_by_year.png")),
+                'word cloud': lambda: self.create_word_cloud(
+                    os.path.join(output_dir, "abstract_wordcloud.png")),
+                'CSV export': save_csv,
+            }
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {executor.submit(task): name
+                           for name, task in tasks.items()}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.warning(f"Error generating {futures[future]}: {e}")
         
         logger.info(f"Analysis report generated in {output_dir}")
         return report_path 
\ No newline at end of file
@@ -4,7 +4,11 @@ Configuration settings for NBER Papers Scraper
 
 class Config:
     """Configuration settings with sensible defaults."""
-    
+
+    # Frozen set of known option names, captured from the first instance;
+    # lets update() validate keys with one hash lookup instead of hasattr
+    _FIELDS = None
+
     def __init__(self):
         # Scraping settings
         self.base_url = "https://www.nber.org"
@@ -26,14 +30,16 @@ class Config:
         
         # User agent for requests
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    
+
+        if Config._FIELDS is None:
+            Config._FIELDS = frozenset(self.__dict__)
+
     def update(self, **kwargs):
         """Update configuration with new values."""
         for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-            else:
+            if key not in self._FIELDS:
                 raise ValueError(f"Unknown configuration option: {key}")
+            setattr(self, key, value)
     
     def __repr__(self):
         attrs = [f"{k}={v}" for k, v in self.__dict__.items()]
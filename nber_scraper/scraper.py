@@ -3,12 +3,17 @@ NBER Scraper - Extract working papers and abstracts from NBER website
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import json
+import threading
 import time
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, wait
+from html import unescape
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from lxml import html as lhtml
 from datetime import datetime
 import logging
 
@@ -16,27 +21,253 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# selectolax parses HTML an order of magnitude faster than lxml's HTML
+# parser; fall back to direct lxml when it is not installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# aiohttp enables concurrent paper fetches; without it the scraper falls
+# back to the sequential requests-based loop
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# orjson serializes several times faster than stdlib json and always
+# emits UTF-8 bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyahocorasick lets the multi-keyword AI filter scan each string once
+# instead of once per pattern
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# CSS selectors for the abstract container, combined into one selector
+# group so each parse does a single tree traversal instead of up to seven.
+# Matching becomes document order rather than list order, which is fine
+# because at most one of these containers appears on a paper page.
+ABSTRACT_SELECTOR = ', '.join([
+    'div.page-header__intro',  # NBER's actual abstract container
+    'div.page-header__intro--centered',
+    'div.abstract-content',
+    'div.abstract',
+    'div[class*="abstract"]',
+    'p.abstract',
+    'section.abstract'
+])
+
+
+# Precompiled once; these run for every paper page scraped
+_ABSTRACT_PREFIX_RE = re.compile(r'^Abstract:?\s*', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_ABSTRACT_DIV_RE = re.compile(r'<div class="page-header__intro[^"]*"[^>]*>(.*?)</div>',
+                              re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_ABSTRACT_BODY_RE = re.compile(r'Abstract:?\s*(.{100,2000}?)(?:\n\n|\r\n\r\n|JEL|Keywords|$)',
+                               re.IGNORECASE | re.DOTALL)
+
+# Keywords matched for an "AI" search: AI as a whole word plus variations
+_AI_KEYWORDS = [
+    'ai',
+    'artificial intelligence',
+    'machine learning',
+    'deep learning',
+    'neural network',
+    'algorithm'
+]
+
+_AI_SEARCH_TERMS = [rf'\b{re.escape(keyword)}\b' for keyword in _AI_KEYWORDS]
+
+# A ranged GET for the first 8 KB covers the <head> metas and the
+# abstract div on standard paper pages, a fraction of the full page
+_HEAD_RANGE_BYTES = 8192
+
+
+def _is_word_char(char):
+    """Word character in the regex \\b sense"""
+    return char.isalnum() or char == '_'
+
+
+def _parse_date(value):
+    """Parse a YYYY/MM/DD or YYYY-MM-DD date string; None if unparseable"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value.replace('/', '-'), '%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def _clean_abstract(text):
+    """Strip a leading 'Abstract:' label and normalize whitespace"""
+    text = _ABSTRACT_PREFIX_RE.sub('', text.strip())
+    return _WHITESPACE_RE.sub(' ', text)
+
+
+def _find_abstract_in_text(text_content):
+    """Look for an abstract-shaped section in plain page text"""
+    abstract_match = _ABSTRACT_BODY_RE.search(text_content)
+    if abstract_match:
+        return abstract_match.group(1).strip()
+    return None
+
 class NBERScraper:
-    def __init__(self, search_query="", base_url="https://www.nber.org", delay=1.0, 
-                 start_date=None, end_date=None):
+    def __init__(self, search_query="", base_url="https://www.nber.org", delay=1.0,
+                 start_date=None, end_date=None, cache_dir=".cache", refresh=False):
         self.search_query = search_query.lower() if search_query else ""
         self.base_url = base_url
         self.delay = delay
         self.start_date = start_date  # Format: "YYYY/MM/DD" or "YYYY-MM-DD"
         self.end_date = end_date      # Format: "YYYY/MM/DD" or "YYYY-MM-DD"
+        # Parse the range bounds once; invalid formats are ignored as before
+        start_dt = _parse_date(start_date)
+        end_dt = _parse_date(end_date)
+        self._start_ord = start_dt.toordinal() if start_dt else None
+        self._end_ord = end_dt.toordinal() if end_dt else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Everything goes to one host, so keep a pool of warm connections
+        # instead of paying the TCP/TLS handshake per request
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.papers = []
-        
-    def get_page(self, url, retries=3):
-        """Fetch a page with retry logic"""
+        self.max_consecutive_failures = 50  # Stop after this many consecutive 404s
+        # Stop after this many consecutive papers older than start_date;
+        # a small run is tolerated because revised papers can appear
+        # slightly out of date order
+        self.max_out_of_range_run = 20
+        # Parsed metadata is cached on disk so reruns (e.g. tweaking the
+        # query or date range) skip the network; set cache_dir=None to
+        # disable, refresh=True to refetch everything
+        self.cache_dir = cache_dir
+        self.refresh = refresh
+        self._progress_file = None  # Append-only JSONL checkpoint, opened lazily
+        # PDF downloads run on their own bounded pool so they don't stall
+        # metadata scraping; created lazily since most runs skip PDFs
+        self._pdf_pool = None
+        self._pdf_futures = []
+        # Rate limiter state: the next monotonic instant a request may
+        # start; the lock makes slot reservation safe across worker threads
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+        # lxml parsers are reusable but not thread-safe, so each worker
+        # thread lazily gets its own configured instance
+        self._lxml_local = threading.local()
+        # Compile the search patterns once; matches_search_query runs per paper
+        self._search_patterns = self._build_search_patterns()
+        self._search_automaton = self._build_search_automaton()
+
+    def _lxml_parser(self):
+        """Per-thread reusable lxml HTML parser"""
+        parser = getattr(self._lxml_local, 'parser', None)
+        if parser is None:
+            parser = lhtml.HTMLParser(recover=True, no_network=True, huge_tree=False)
+            self._lxml_local.parser = parser
+        return parser
+
+    def _build_search_automaton(self):
+        """
+        Build an Aho-Corasick automaton for the AI keyword variants.
+
+        The automaton scans a string once and reports every keyword hit,
+        versus one linear pass per pattern with the regex list. Only built
+        for the multi-keyword "ai" query and only when pyahocorasick is
+        installed; word boundaries are verified on the characters around
+        each hit to match the regex \\b semantics.
+        """
+        if not AHOCORASICK_AVAILABLE or self.search_query != "ai":
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for keyword in _AI_KEYWORDS:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    def _automaton_search(self, text):
+        """True if any keyword occurs in text as a whole word"""
+        text = text.lower()
+        length = len(text)
+        for end, keyword in self._search_automaton.iter(text):
+            start = end - len(keyword) + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end + 1 < length and _is_word_char(text[end + 1]):
+                continue
+            return True
+        return False
+
+    def _build_search_patterns(self):
+        """Compile the search query into a list of regex patterns"""
+        if not self.search_query:
+            return []
+
+        if self.search_query == "ai":
+            # For AI searches, look for AI as whole word plus variations
+            terms = _AI_SEARCH_TERMS
+        else:
+            # For other topic searches, use word boundaries to avoid partial matches
+            terms = [rf'\b{re.escape(self.search_query)}\b']
+
+        return [re.compile(term, re.IGNORECASE) for term in terms]
+
+    def _throttle(self):
+        """
+        Reserve the next request slot, sleeping only as long as needed.
+
+        Keeps requests at most one per self.delay seconds but never waits
+        when the previous request already took longer than the delay —
+        unlike a flat sleep after every response, which always pays the
+        full delay on top of the response time.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.delay
+        if wait > 0:
+            time.sleep(wait)
+
+    def _retry_after(self, response, attempt):
+        """Backoff before retrying a 429/503: exponential, or Retry-After"""
+        backoff = self.delay * (2 ** attempt)
+        try:
+            backoff = max(backoff, float(response.headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            pass
+        return backoff
+
+    def get_page(self, url, retries=3, byte_range=None):
+        """
+        Fetch a page with rate limiting and retry logic.
+
+        byte_range requests only the first N bytes of the resource; servers
+        that honor it answer 206 with a fragment, servers that ignore it
+        send the full page as usual.
+        """
+        headers = {'Range': f'bytes=0-{byte_range - 1}'} if byte_range else None
         for attempt in range(retries):
+            self._throttle()
             try:
-                response = self.session.get(url, timeout=30)
+                response = self.session.get(url, timeout=30, headers=headers)
+                if response.status_code in (429, 503) and attempt < retries - 1:
+                    backoff = self._retry_after(response, attempt)
+                    logger.warning(f"Got {response.status_code} for {url}, backing off {backoff:.1f}s")
+                    time.sleep(backoff)
+                    continue
                 response.raise_for_status()
-                time.sleep(self.delay)
                 return response
             except requests.RequestException as e:
                 logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
@@ -47,94 +278,188 @@ class NBERScraper:
     def extract_paper_metadata(self, paper_number):
         """Extract metadata from a single working paper using meta tags"""
         url = f"{self.base_url}/papers/w{paper_number}"
-        
+
+        # Serve from the on-disk cache when possible
+        cached = self._cache_get(paper_number)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.get_page(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            # Everything we parse lives in the first few KB, so try a
+            # ranged GET and fall back to the full page only when the
+            # fragment is missing a piece
+            response = self.get_page(url, byte_range=_HEAD_RANGE_BYTES)
+
             # Check if paper exists (404 or not found)
             if response.status_code == 404:
                 return None
-                
-            # Extract data from meta tags
-            paper_data = {
-                'paper_id': f'w{paper_number}',
-                'url': url,
-                'title': None,
-                'authors': [],
-                'abstract': None,
-                'pdf_url': None,
-                'publication_date': None,
-                'doi': None,
-                'scraped_at': datetime.now().isoformat()
-            }
-            
-            # Extract title
-            title_meta = soup.find('meta', attrs={'name': 'citation_title'})
-            if title_meta:
-                paper_data['title'] = title_meta.get('content', '').strip()
-            
-            # Extract authors
-            author_metas = soup.find_all('meta', attrs={'name': 'citation_author'})
-            paper_data['authors'] = [meta.get('content', '').strip() for meta in author_metas if meta.get('content')]
-            
-            # Extract DOI
-            doi_meta = soup.find('meta', attrs={'name': 'citation_doi'})
-            if doi_meta:
-                paper_data['doi'] = doi_meta.get('content', '').strip()
-            
-            # Extract publication date
-            date_meta = soup.find('meta', attrs={'name': 'citation_publication_date'})
-            if date_meta:
-                paper_data['publication_date'] = date_meta.get('content', '').strip()
-            
-            # Extract PDF URL
-            pdf_meta = soup.find('meta', attrs={'name': 'citation_pdf_url'})
-            if pdf_meta:
-                paper_data['pdf_url'] = pdf_meta.get('content', '').strip()
-            
-            # Extract abstract from page content
-            abstract_selectors = [
-                'div.page-header__intro',  # NBER's actual abstract container
-                'div.page-header__intro--centered',
-                'div.abstract-content',
-                'div.abstract',
-                'div[class*="abstract"]',
-                'p.abstract',
-                'section.abstract'
-            ]
-            
-            for selector in abstract_selectors:
-                abstract_elem = soup.select_one(selector)
-                if abstract_elem:
-                    abstract_text = abstract_elem.get_text().strip()
-                    # Clean up abstract text
-                    abstract_text = re.sub(r'^Abstract:?\s*', '', abstract_text, flags=re.IGNORECASE)
-                    abstract_text = re.sub(r'\s+', ' ', abstract_text)  # Normalize whitespace
-                    paper_data['abstract'] = abstract_text
-                    break
-            
-            # If we still don't have an abstract, try to find it in the main content
-            if not paper_data['abstract']:
-                # Look for text that contains typical abstract patterns
-                main_content = soup.find('main') or soup.find('body')
-                if main_content:
-                    text_content = main_content.get_text()
-                    # Look for abstract section
-                    abstract_match = re.search(r'Abstract:?\s*(.{100,2000}?)(?:\n\n|\r\n\r\n|JEL|Keywords|$)', 
-                                            text_content, re.IGNORECASE | re.DOTALL)
-                    if abstract_match:
-                        paper_data['abstract'] = abstract_match.group(1).strip()
-            
+
+            html_text = response.text
+            if response.status_code == 206 and not self._range_sufficient(html_text):
+                response = self.get_page(url)
+                if response.status_code == 404:
+                    return None
+                html_text = response.text
+
+            paper_data = self._new_paper_data(paper_number)
+            self._parse_paper_page(html_text, paper_data)
+            self._cache_put(paper_data)
+
             logger.info(f"Extracted metadata for paper w{paper_number}: {paper_data.get('title', 'No title')}")
             return paper_data
-            
+
         except requests.RequestException as e:
             logger.error(f"Error fetching paper w{paper_number}: {e}")
             return None
         except Exception as e:
             logger.error(f"Error parsing paper w{paper_number}: {e}")
             return None
+
+    def _cache_get(self, paper_number):
+        """Return cached metadata for a paper, or None on miss/refresh"""
+        if not self.cache_dir or self.refresh:
+            return None
+        path = os.path.join(self.cache_dir, f"w{paper_number}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _cache_put(self, paper_data):
+        """Best-effort write of parsed metadata to the on-disk cache"""
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, f"{paper_data['paper_id']}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(paper_data, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"Could not cache {paper_data.get('paper_id')}: {e}")
+
+    @staticmethod
+    def _range_sufficient(html_text):
+        """Does a ranged-GET fragment contain everything the parser needs?"""
+        head_end = html_text.find('</head>')
+        return head_end != -1 and _ABSTRACT_DIV_RE.search(html_text, head_end) is not None
+
+    def _new_paper_data(self, paper_number):
+        """Create an empty metadata record for a working paper"""
+        return {
+            'paper_id': f'w{paper_number}',
+            'url': f"{self.base_url}/papers/w{paper_number}",
+            'title': None,
+            'authors': [],
+            'abstract': None,
+            'pdf_url': None,
+            'publication_date': None,
+            'doi': None,
+            'scraped_at': datetime.now().isoformat()
+        }
+
+    def _parse_paper_page(self, html_text, paper_data):
+        """Populate paper_data from page HTML with the fastest parser available"""
+        if self._parse_head_only(html_text, paper_data):
+            return
+        if SELECTOLAX_AVAILABLE:
+            self._parse_with_selectolax(html_text, paper_data)
+        else:
+            self._parse_with_lxml(html_text, paper_data)
+
+    def _parse_head_only(self, html_text, paper_data):
+        """
+        Fast path: build a DOM for just the <head> (where all the citation
+        metas live) and pull the abstract div out of the body with a regex,
+        skipping the full-page tree build. Returns False when the page does
+        not look like a standard paper page so the caller can fall back to
+        a full parse.
+        """
+        head_end = html_text.find('</head>')
+        if head_end == -1:
+            return False
+
+        abstract_match = _ABSTRACT_DIV_RE.search(html_text, head_end)
+        if not abstract_match:
+            return False
+
+        head_html = html_text[:head_end + len('</head>')]
+        if SELECTOLAX_AVAILABLE:
+            self._parse_with_selectolax(head_html, paper_data)
+        else:
+            self._parse_with_lxml(head_html, paper_data)
+
+        abstract_text = unescape(_TAG_RE.sub(' ', abstract_match.group(1)))
+        paper_data['abstract'] = _clean_abstract(abstract_text)
+        return True
+
+    def _parse_with_selectolax(self, html_text, paper_data):
+        """Populate paper_data from page HTML using selectolax (fast path)"""
+        tree = LexborHTMLParser(html_text)
+
+        def meta_content(name):
+            meta = tree.css_first(f'meta[name="{name}"]')
+            if meta:
+                return (meta.attributes.get('content') or '').strip()
+            return None
+
+        paper_data['title'] = meta_content('citation_title')
+        paper_data['doi'] = meta_content('citation_doi')
+        paper_data['publication_date'] = meta_content('citation_publication_date')
+        paper_data['pdf_url'] = meta_content('citation_pdf_url')
+
+        paper_data['authors'] = [
+            (meta.attributes.get('content') or '').strip()
+            for meta in tree.css('meta[name="citation_author"]')
+            if meta.attributes.get('content')
+        ]
+
+        # Extract abstract from page content
+        abstract_elem = tree.css_first(ABSTRACT_SELECTOR)
+        if abstract_elem:
+            paper_data['abstract'] = _clean_abstract(abstract_elem.text())
+
+        # If we still don't have an abstract, try to find it in the main content
+        if not paper_data['abstract']:
+            main_content = tree.css_first('main') or tree.body
+            if main_content is not None:
+                paper_data['abstract'] = _find_abstract_in_text(main_content.text())
+
+    def _parse_with_lxml(self, html_text, paper_data):
+        """Populate paper_data from page HTML using lxml directly (fallback)"""
+        doc = lhtml.fromstring(html_text, parser=self._lxml_parser())
+
+        # One XPath traversal collects every citation meta
+        metas = {}
+        for meta in doc.xpath('//meta[starts-with(@name, "citation_")]'):
+            name = meta.get('name')
+            if name not in metas:
+                metas[name] = (meta.get('content') or '').strip()
+
+        paper_data['title'] = metas.get('citation_title')
+        paper_data['doi'] = metas.get('citation_doi')
+        paper_data['publication_date'] = metas.get('citation_publication_date')
+        paper_data['pdf_url'] = metas.get('citation_pdf_url')
+
+        paper_data['authors'] = [
+            content.strip()
+            for content in doc.xpath('//meta[@name="citation_author"]/@content')
+            if content.strip()
+        ]
+
+        # Extract abstract from page content
+        elems = doc.cssselect(ABSTRACT_SELECTOR)
+        if elems:
+            paper_data['abstract'] = _clean_abstract(elems[0].text_content())
+
+        # If we still don't have an abstract, try to find it in the main content
+        if not paper_data['abstract']:
+            main_content = doc.xpath('//main') or doc.xpath('//body')
+            if main_content:
+                paper_data['abstract'] = _find_abstract_in_text(main_content[0].text_content())
     
     def matches_search_query(self, paper_data):
         """
@@ -147,41 +472,26 @@ class NBERScraper:
         For "AI" searches, also looks for related terms like "artificial intelligence",
         "machine learning", "deep learning", etc.
         """
-        if not self.search_query:
+        if not self._search_patterns:
             return True
-            
-        query_lower = self.search_query.lower().strip()
-        
-        # Prepare search terms
-        search_terms = []
-        
-        if query_lower == "ai":
-            # For AI searches, look for AI as whole word plus variations
-            search_terms = [
-                r'\bai\b',  # AI as whole word
-                r'\bartificial intelligence\b',
-                r'\bmachine learning\b',
-                r'\bdeep learning\b',
-                r'\bneural network\b',
-                r'\balgorithm\b'
-            ]
-        else:
-            # For other topic searches, use word boundaries to avoid partial matches
-            escaped_query = re.escape(query_lower)
-            search_terms = [rf'\b{escaped_query}\b']
-        
+
+        # Single-scan multi-keyword path for the AI variants
+        if self._search_automaton is not None:
+            return (self._automaton_search(paper_data.get('title') or '')
+                    or self._automaton_search(paper_data.get('abstract') or ''))
+
         # Search in title
-        title = (paper_data.get('title') or '').lower()
-        for term in search_terms:
-            if re.search(term, title, re.IGNORECASE):
+        title = paper_data.get('title') or ''
+        for pattern in self._search_patterns:
+            if pattern.search(title):
                 return True
-                
+
         # Search in abstract
-        abstract = (paper_data.get('abstract') or '').lower()
-        for term in search_terms:
-            if re.search(term, abstract, re.IGNORECASE):
+        abstract = paper_data.get('abstract') or ''
+        for pattern in self._search_patterns:
+            if pattern.search(abstract):
                 return True
-                
+
         return False
     
     def matches_date_range(self, paper_data):
@@ -193,75 +503,99 @@ class NBERScraper:
         - Paper has no date (we include it to be safe)
         - Paper date falls within the specified range
         """
-        if not self.start_date and not self.end_date:
-            return True
-            
-        pub_date = paper_data.get('publication_date')
-        if not pub_date:
-            return True  # Include papers without dates
-            
-        try:
-            # Parse the publication date (NBER format is usually YYYY/MM/DD)
-            if '/' in pub_date:
-                paper_date = datetime.strptime(pub_date, '%Y/%m/%d')
-            elif '-' in pub_date:
-                paper_date = datetime.strptime(pub_date, '%Y-%m-%d')
-            else:
-                return True  # If we can't parse it, include it
-            
-            # Check start date
-            if self.start_date:
-                try:
-                    if '/' in self.start_date:
-                        start_dt = datetime.strptime(self.start_date, '%Y/%m/%d')
-                    else:
-                        start_dt = datetime.strptime(self.start_date, '%Y-%m-%d')
-                    
-                    if paper_date < start_dt:
-                        return False
-                except:
-                    pass  # If start_date format is invalid, ignore it
-            
-            # Check end date
-            if self.end_date:
-                try:
-                    if '/' in self.end_date:
-                        end_dt = datetime.strptime(self.end_date, '%Y/%m/%d')
-                    else:
-                        end_dt = datetime.strptime(self.end_date, '%Y-%m-%d')
-                    
-                    if paper_date > end_dt:
-                        return False
-                except:
-                    pass  # If end_date format is invalid, ignore it
-            
+        if self._start_ord is None and self._end_ord is None:
             return True
-            
-        except:
-            return True  # If any parsing fails, include the paper
-    
+
+        # Parse the publication date (NBER format is usually YYYY/MM/DD)
+        paper_date = _parse_date(paper_data.get('publication_date'))
+        if paper_date is None:
+            return True  # Include papers without parseable dates
+
+        paper_ord = paper_date.toordinal()
+        if self._start_ord is not None and paper_ord < self._start_ord:
+            return False
+        if self._end_ord is not None and paper_ord > self._end_ord:
+            return False
+        return True
+
+    def _past_start_date(self, paper_data):
+        """True if the paper's parseable publication date precedes start_date"""
+        if self._start_ord is None:
+            return False
+        paper_date = _parse_date(paper_data.get('publication_date'))
+        return paper_date is not None and paper_date.toordinal() < self._start_ord
+
+
+    def _submit_pdf_download(self, paper_data):
+        """Queue a PDF download on the worker pool instead of blocking"""
+        if self._pdf_pool is None:
+            self._pdf_pool = ThreadPoolExecutor(max_workers=4)
+        self._pdf_futures.append(self._pdf_pool.submit(
+            self.download_pdf, paper_data['pdf_url'], paper_data['paper_id']))
+
     def download_pdf(self, pdf_url, paper_id, download_dir="downloads"):
-        """Download a PDF file"""
+        """Download a PDF file, streaming it straight to disk"""
         if not pdf_url:
             return False
-            
+
         try:
             os.makedirs(download_dir, exist_ok=True)
-            
-            response = self.get_page(pdf_url)
             filename = f"{paper_id}.pdf"
             filepath = os.path.join(download_dir, filename)
-            
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
+
+            # Stream in chunks so a multi-MB PDF never sits fully
+            # buffered in memory before the first byte hits disk
+            self._throttle()
+            with self.session.get(pdf_url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+
             logger.info(f"Downloaded PDF: {filename}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Error downloading PDF {pdf_url}: {e}")
             return False
     
+    def _paper_exists(self, paper_number):
+        """HEAD probe: does the page for this working paper exist?"""
+        try:
+            response = self.session.head(f"{self.base_url}/papers/w{paper_number}", timeout=10)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def _find_latest_paper_number(self, low=33000, high=33500, step=50):
+        """
+        Locate the most recent working paper number, or None if no probe hits.
+
+        Issues one concurrent round of HEAD probes across [low, high], then
+        binary-searches the gap above the highest number that exists —
+        ~log2(step) serial requests instead of the old walk of up to 50.
+        """
+        probes = list(range(low, high + 1, step))
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            exists = dict(zip(probes, pool.map(self._paper_exists, probes)))
+
+        alive = [number for number in probes if exists[number]]
+        if not alive:
+            return None
+
+        # Highest probe that exists bounds the search from below; the next
+        # probe (or one step beyond the range) bounds it from above
+        latest = max(alive)
+        upper = latest + step
+        while latest + 1 < upper:
+            mid = (latest + upper) // 2
+            if self._paper_exists(mid):
+                latest = mid
+            else:
+                upper = mid
+
+        return latest
+
     def scrape_papers(self, max_papers=None, max_pages=None, start_number=None, download_pdfs=False):
         """
         Scrape NBER working papers starting from recent papers and working backwards
@@ -276,93 +610,276 @@ class NBERScraper:
         # Auto-detect the most recent paper number if not provided
         if start_number is None:
             logger.info("Auto-detecting most recent paper number...")
-            # Start from a high number and work backwards to find the latest
-            for test_num in range(33500, 33000, -10):  # Test every 10th number
-                test_url = f"{self.base_url}/papers/w{test_num}"
-                try:
-                    response = self.session.head(test_url, timeout=10)
-                    if response.status_code == 200:
-                        start_number = test_num + 10  # Add buffer
-                        logger.info(f"Starting from paper number w{start_number}")
-                        break
-                except:
-                    continue
-            
-            if start_number is None:
+            latest = self._find_latest_paper_number()
+            if latest is not None:
+                start_number = latest + 10  # Add buffer
+                logger.info(f"Starting from paper number w{start_number}")
+            else:
                 start_number = 33200  # Fallback
                 logger.info(f"Using fallback start number w{start_number}")
         
-        papers_checked = 0
-        papers_found = 0
-        consecutive_failures = 0
-        max_consecutive_failures = 50  # Stop if we hit 50 consecutive 404s
-        
         logger.info(f"Starting scrape from paper w{start_number}")
         logger.info(f"Search query: '{self.search_query}'" if self.search_query else "No search filter")
         logger.info(f"Max papers: {max_papers}")
         logger.info(f"Max to check: {max_pages}")
-        
+
+        if AIOHTTP_AVAILABLE:
+            papers_checked, papers_found = asyncio.run(self._scrape_concurrent(
+                max_papers, max_pages, start_number, download_pdfs))
+        else:
+            papers_checked, papers_found = self._scrape_sequential(
+                max_papers, max_pages, start_number, download_pdfs)
+
+        # Let any PDF downloads still in flight drain before returning
+        if self._pdf_futures:
+            logger.info(f"Waiting for {len(self._pdf_futures)} PDF downloads to finish")
+            wait(self._pdf_futures)
+            self._pdf_futures = []
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=True)
+            self._pdf_pool = None
+
+        if self._progress_file is not None:
+            self._progress_file.close()
+            self._progress_file = None
+
+        logger.info(f"Scraping completed: checked {papers_checked} papers, found {papers_found} matching papers")
+        return self.papers
+
+    def _should_stop(self, papers_found, papers_checked, consecutive_failures,
+                     current_number, max_papers, max_pages):
+        """Check the shared stopping conditions for the scrape loops"""
+        if max_papers and papers_found >= max_papers:
+            logger.info(f"Reached maximum papers limit: {max_papers}")
+            return True
+
+        if max_pages and papers_checked >= max_pages:
+            logger.info(f"Reached maximum papers to check limit: {max_pages}")
+            return True
+
+        if consecutive_failures >= self.max_consecutive_failures:
+            logger.info(f"Reached {self.max_consecutive_failures} consecutive failures, stopping")
+            return True
+
+        if current_number <= 0:
+            logger.info("Reached paper number 0, stopping")
+            return True
+
+        return False
+
+    def _record_paper(self, paper_data, papers_found):
+        """Accept a matching paper: store it, log it, and checkpoint progress"""
+        self.papers.append(paper_data)
+        papers_found += 1
+
+        logger.info(f"Found matching paper {papers_found}: {paper_data['paper_id']} - {(paper_data.get('title') or 'No title')[:100]}")
+
+        # Append to the JSONL checkpoint: O(1) per paper and crash-resilient,
+        # unlike rewriting the whole accumulated list every few papers
+        try:
+            if self._progress_file is None:
+                self._progress_file = open('nber_papers_progress.jsonl', 'a', encoding='utf-8')
+            self._progress_file.write(json.dumps(paper_data, ensure_ascii=False) + '\n')
+            self._progress_file.flush()
+        except Exception as e:
+            logger.warning(f"Could not checkpoint progress: {e}")
+
+        return papers_found
+
+    def _scrape_sequential(self, max_papers, max_pages, start_number, download_pdfs):
+        """Fetch papers one at a time with the shared requests session"""
+        papers_checked = 0
+        papers_found = 0
+        consecutive_failures = 0
+        out_of_range_run = 0
         current_number = start_number
-        
-        while True:
-            # Check stopping conditions
-            if max_papers and papers_found >= max_papers:
-                logger.info(f"Reached maximum papers limit: {max_papers}")
-                break
-                
-            if max_pages and papers_checked >= max_pages:
-                logger.info(f"Reached maximum papers to check limit: {max_pages}")
-                break
-                
-            if consecutive_failures >= max_consecutive_failures:
-                logger.info(f"Reached {max_consecutive_failures} consecutive failures, stopping")
-                break
-                
-            if current_number <= 0:
-                logger.info("Reached paper number 0, stopping")
-                break
-            
+
+        while not self._should_stop(papers_found, papers_checked, consecutive_failures,
+                                    current_number, max_papers, max_pages):
             papers_checked += 1
-            
+
             # Extract paper metadata
             paper_data = self.extract_paper_metadata(current_number)
-            
+
             if paper_data is None:
                 consecutive_failures += 1
                 current_number -= 1
                 continue
             else:
                 consecutive_failures = 0  # Reset failure counter
-            
+
             # Check if paper matches search criteria and date range
             if self.matches_search_query(paper_data) and self.matches_date_range(paper_data):
-                self.papers.append(paper_data)
-                papers_found += 1
-                
-                logger.info(f"Found matching paper {papers_found}: w{current_number} - {paper_data.get('title', 'No title')[:100]}")
-                
+                papers_found = self._record_paper(paper_data, papers_found)
+
                 # Download PDF if requested
                 if download_pdfs and paper_data.get('pdf_url'):
-                    self.download_pdf(paper_data['pdf_url'], paper_data['paper_id'])
-                
-                # Save progress periodically
-                if papers_found % 10 == 0:
-                    self.save_to_json(f"nber_papers_progress_{papers_found}.json")
-            
+                    self._submit_pdf_download(paper_data)
+
+            # Paper numbers descend and are assigned chronologically, so a
+            # sustained run of papers older than start_date means everything
+            # below is out of range too
+            if self._past_start_date(paper_data):
+                out_of_range_run += 1
+                if out_of_range_run >= self.max_out_of_range_run:
+                    logger.info(f"Last {out_of_range_run} papers predate start_date, stopping")
+                    break
+            else:
+                out_of_range_run = 0
+
             current_number -= 1
-            
+
             # Progress update
             if papers_checked % 50 == 0:
                 logger.info(f"Progress: checked {papers_checked} papers, found {papers_found} matching papers")
-        
-        logger.info(f"Scraping completed: checked {papers_checked} papers, found {papers_found} matching papers")
-        return self.papers
+
+        return papers_checked, papers_found
+
+    async def _throttle_async(self):
+        """
+        Async twin of _throttle: reserve a slot, sleep out the remainder.
+
+        Reserves under the same threading lock as the sync path so PDF
+        worker threads and event-loop fetches share one rate budget; the
+        critical section never blocks, so holding a thread lock briefly
+        on the loop is harmless.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _fetch_paper_async(self, session, semaphore, paper_number, retries=3):
+        """Fetch one paper page; returns (paper_number, html or None)"""
+        url = f"{self.base_url}/papers/w{paper_number}"
+        range_headers = {'Range': f'bytes=0-{_HEAD_RANGE_BYTES - 1}'}
+        async with semaphore:
+            for attempt in range(retries):
+                try:
+                    # Same ranged-GET-with-fallback scheme as get_page
+                    await self._throttle_async()
+                    async with session.get(url, headers=range_headers) as response:
+                        if response.status == 404:
+                            return paper_number, None
+                        response.raise_for_status()
+                        html = await response.text()
+                        partial = response.status == 206
+                    if partial and not self._range_sufficient(html):
+                        await self._throttle_async()
+                        async with session.get(url) as response:
+                            if response.status == 404:
+                                return paper_number, None
+                            response.raise_for_status()
+                            html = await response.text()
+                    return paper_number, html
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+                    if attempt == retries - 1:
+                        return paper_number, None
+                    await asyncio.sleep(self.delay * 2)
+
+    async def _scrape_concurrent(self, max_papers, max_pages, start_number,
+                                 download_pdfs, batch_size=25, max_concurrency=8):
+        """
+        Fetch papers in concurrent descending-ID batches with aiohttp.
+
+        Results are processed strictly in descending order after each batch,
+        so the matching, consecutive-404, and limit semantics are identical
+        to the sequential loop; at most one batch of fetches can overshoot
+        the limits.
+        """
+        papers_checked = 0
+        papers_found = 0
+        consecutive_failures = 0
+        out_of_range_run = 0
+        current_number = start_number
+
+        loop = asyncio.get_running_loop()
+
+        connector = aiohttp.TCPConnector(limit_per_host=max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers)) as session:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            stopped = False
+
+            while not stopped and current_number > 0:
+                batch = list(range(current_number, max(current_number - batch_size, 0), -1))
+
+                # Cached papers don't need a fetch at all
+                cached = {number: self._cache_get(number) for number in batch}
+                to_fetch = [number for number in batch if cached[number] is None]
+                results = await asyncio.gather(*[
+                    self._fetch_paper_async(session, semaphore, number)
+                    for number in to_fetch
+                ])
+                html_by_number = dict(results)
+
+                for number in batch:
+                    if self._should_stop(papers_found, papers_checked, consecutive_failures,
+                                         number, max_papers, max_pages):
+                        stopped = True
+                        break
+
+                    papers_checked += 1
+
+                    paper_data = cached[number]
+                    if paper_data is None:
+                        html = html_by_number[number]
+                        if html is None:
+                            consecutive_failures += 1
+                            continue
+
+                        paper_data = self._new_paper_data(number)
+                        try:
+                            # Parsing is CPU work; keep it off the event loop
+                            await loop.run_in_executor(None, self._parse_paper_page, html, paper_data)
+                        except Exception as e:
+                            logger.error(f"Error parsing paper w{number}: {e}")
+                            continue
+                        self._cache_put(paper_data)
+
+                    consecutive_failures = 0
+
+                    logger.info(f"Extracted metadata for paper w{number}: {paper_data.get('title', 'No title')}")
+
+                    if self.matches_search_query(paper_data) and self.matches_date_range(paper_data):
+                        papers_found = self._record_paper(paper_data, papers_found)
+
+                        # Download PDF if requested
+                        if download_pdfs and paper_data.get('pdf_url'):
+                            self._submit_pdf_download(paper_data)
+
+                    # Same descending-ID short-circuit as the sequential loop
+                    if self._past_start_date(paper_data):
+                        out_of_range_run += 1
+                        if out_of_range_run >= self.max_out_of_range_run:
+                            logger.info(f"Last {out_of_range_run} papers predate start_date, stopping")
+                            stopped = True
+                            break
+                    else:
+                        out_of_range_run = 0
+
+                    if papers_checked % 50 == 0:
+                        logger.info(f"Progress: checked {papers_checked} papers, found {papers_found} matching papers")
+
+                current_number = batch[-1] - 1
+
+        return papers_checked, papers_found
     
     def save_to_json(self, filename):
         """Save collected papers to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.papers, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(self.papers, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(self.papers, f, indent=2, ensure_ascii=False)
             logger.info(f"Saved {len(self.papers)} papers to {filename}")
             return True
         except Exception as e: